@@ -5,7 +5,7 @@ __all__ = ("export_environment",)
 
 def export_environment():
     """Generate bash script to regenerate the current environment"""
-    output = ""
+    lines = []
     for key, val in os.environ.items():
         if key in ("DISPLAY",):
             continue
@@ -19,8 +19,9 @@ def export_environment():
             if key.startswith("BASH_FUNC_") and key.endswith("()"):
                 key = key[10:-2]
 
-            output += "{key} {val}\nexport -f {key}\n".format(key=key, val=val)
+            lines.append(f"{key} {val}\nexport -f {key}\n")
         else:
             # This is a variable.
-            output += "export {key}='{val}'\n".format(key=key, val=val.replace("'", "'\"'\"'"))
-    return output
+            val = val.replace("'", "'\"'\"'")
+            lines.append(f"export {key}='{val}'\n")
+    return "".join(lines)
@@ -1,7 +1,6 @@
 import os
 import re
 import subprocess
-from functools import partial
 from typing import Callable, Dict, List, Optional, Sequence
 
 from lsst.ctrl.bps import BpsConfig, GenericWorkflow, GenericWorkflowJob
@@ -11,8 +10,8 @@ from .configuration import get_bps_config_value
 
 __all__ = ("get_file_paths", "ParslJob")
 
-_env_regex = re.compile(r"<ENV:(\S+)>")  # Regex for replacing <ENV:WHATEVER> in BPS job command-lines
-_file_regex = re.compile(r"<FILE:(\S+)>")  # Regex for replacing <FILE:WHATEVER> in BPS job command-lines
+# Regex for replacing <ENV:WHATEVER> and <FILE:WHATEVER> in BPS job command-lines
+_symbol_regex = re.compile(r"<(ENV|FILE):([^\s>]+)>")
 
 
 def run_command(
@@ -62,6 +61,22 @@ def get_file_paths(workflow: GenericWorkflow, name: str) -> Dict[str, str]:
     return {ff.name: ff.src_uri for ff in workflow.get_job_inputs(name)}
 
 
+def _get_log_dir(config: BpsConfig) -> str:
+    """Get the directory for job logs
+
+    Parameters
+    ----------
+    config : `BpsConfig`
+        BPS configuration.
+
+    Returns
+    -------
+    log_dir : `str`
+        Directory for job logs.
+    """
+    return os.path.join(get_bps_config_value(config, "submitPath"), "logs")
+
+
 class ParslJob:
     """Job to execute with parsl
 
@@ -73,6 +88,10 @@ class ParslJob:
         BPS configuration.
     file_paths : `dict` mapping `str` to `str`
         File paths for job, indexed by symbolic name.
+    log_dir : `str`, optional
+        Directory for job logs. If not provided, it is derived from the
+        ``submitPath`` in the ``config``; providing it avoids a configuration
+        lookup for every job.
     """
 
     def __init__(
@@ -80,6 +99,7 @@ class ParslJob:
         generic: GenericWorkflowJob,
         config: BpsConfig,
         file_paths: Dict[str, str],
+        log_dir: Optional[str] = None,
     ):
         self.generic = generic
         self.name = generic.name
@@ -87,13 +107,16 @@ class ParslJob:
         self.file_paths = file_paths
         self.future = None
         self.done = False
-        log_dir = os.path.join(get_bps_config_value(self.config, "submitPath"), "logs")
+        self._command: Optional[str] = None  # Evaluated command-line; not pickled
+        if log_dir is None:
+            log_dir = _get_log_dir(self.config)
+        self.log_dir = log_dir
         self.stdout = os.path.join(log_dir, self.name + ".stdout")
         self.stderr = os.path.join(log_dir, self.name + ".stderr")
 
     def __reduce__(self):
         """Recipe for pickling"""
-        return type(self), (self.generic, self.config, self.file_paths)
+        return type(self), (self.generic, self.config, self.file_paths, self.log_dir)
 
     def get_command_line(self) -> str:
         """Get the bash command-line to run to execute this job"""
@@ -125,14 +148,34 @@ class ParslJob:
         command : `str`
             Command ready for execution on a worker.
         """
-        command = command.format(**self.generic.cmdvals)  # BPS variables
-        command = re.sub(_env_regex, r"${\g<1>}", command)  # Environment variables
-        command = re.sub(_file_regex, lambda match: self.file_paths[match.group(1)], command)  # Files
-        return command
+        command = command.format_map(self.generic.cmdvals)  # BPS variables
+        return _symbol_regex.sub(self._substitute_symbol, command)
+
+    def _substitute_symbol(self, match: re.Match) -> str:
+        """Return the replacement for an ``<ENV:...>`` or ``<FILE:...>`` symbol"""
+        if match.group(1) == "ENV":
+            return "${" + match.group(2) + "}"  # Environment variables
+        return self.file_paths[match.group(2)]  # Files
+
+    def get_evaluated_command_line(self) -> str:
+        """Get the evaluated bash command-line to run to execute this job
+
+        The result is cached after the first call, which assumes that the
+        executable, arguments, ``generic.cmdvals`` and ``file_paths`` are not
+        modified after construction.
+
+        Returns
+        -------
+        command : `str`
+            Command ready for execution on a worker.
+        """
+        if self._command is None:
+            self._command = self.evaluate_command_line(self.get_command_line())
+        return self._command
 
     def get_future(
         self,
-        app: Callable[[Callable[[str, Sequence[Future], Optional[str], Optional[str]], str]], Future],
+        app: Callable[..., Future],
         inputs: List[Future],
         command_prefix: Optional[str] = None,
     ) -> Optional[Future]:
@@ -144,7 +187,7 @@ class ParslJob:
         Parameters
         ----------
         app : callable
-            A parsl bash_app decorator to use.
+            Parsl app that runs the job command.
         inputs : list of `Future`
             Dependencies to be satisfied before executing this job.
         command_prefix : `str`, optional
@@ -160,17 +203,11 @@ class ParslJob:
         if self.done:
             return None  # Nothing to do
         if not self.future:
-            command = self.get_command_line()
-            command = self.evaluate_command_line(command)
+            command = self.get_evaluated_command_line()
             if command_prefix:
-                command = command_prefix + "\n" + command
-
-            # Add a layer of indirection to which we can add a useful name.
-            # This name is used by parsl for tracking workflow status.
-            func = partial(run_command)
-            setattr(func, "__name__", self.generic.label)
+                command = f"{command_prefix}\n{command}"
 
-            self.future = app(func)(command, inputs=inputs, stdout=self.stdout, stderr=self.stderr)
+            self.future = app(command, inputs=inputs, stdout=self.stdout, stderr=self.stderr)
         return self.future
 
     def run_local(self):
@@ -181,8 +218,7 @@ class ParslJob:
         """
         if self.done:  # Nothing to do
             return
-        command = self.get_command_line()
-        command = self.evaluate_command_line(command)
+        command = self.get_evaluated_command_line()
         with open(self.stdout, "w") as stdout, open(self.stderr, "w") as stderr:
             subprocess.check_call(command, shell=True, executable="/bin/bash", stdout=stdout, stderr=stderr)
         self.done = True
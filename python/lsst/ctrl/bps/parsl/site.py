@@ -1,4 +1,6 @@
+import sqlite3
 from abc import ABC, abstractmethod
+from contextlib import closing
 from typing import TYPE_CHECKING, List, Optional
 
 from lsst.ctrl.bps import BpsConfig
@@ -31,6 +33,8 @@ class SiteConfig(ABC):
     def __init__(self, config: BpsConfig):
         self.config = config
         self.site = self.get_site_subconfig(config)
+        self._command_prefix: Optional[str] = None
+        self._environment: Optional[str] = None
 
     @staticmethod
     def get_site_subconfig(config: BpsConfig) -> BpsConfig:
@@ -116,6 +120,16 @@ class SiteConfig(ABC):
         """
         return address_by_hostname()
 
+    def get_environment(self) -> str:
+        """Return bash commands that replicate the current environment
+
+        The environment is exported on the first call, and reused thereafter,
+        so that all users of this site configuration share the same export.
+        """
+        if self._environment is None:
+            self._environment = export_environment()
+        return self._environment
+
     def get_command_prefix(self) -> str:
         """Return command(s) to add before each job command
 
@@ -127,11 +141,15 @@ class SiteConfig(ABC):
           prefix to executing a job command on a worker.
         - ``site.<computeSite>.environment`` (`bool`): add bash commands that
           replicate the environment on the driver/submit machine?
+
+        The prefix is constructed on the first call, and reused thereafter.
         """
-        prefix = get_bps_config_value(self.site, "commandPrefix", str, "")
-        if get_bps_config_value(self.site, "environment", bool, False):
-            prefix += "\n" + export_environment()
-        return prefix
+        if self._command_prefix is None:
+            prefix = get_bps_config_value(self.site, "commandPrefix", str, "")
+            if get_bps_config_value(self.site, "environment", bool, False):
+                prefix += "\n" + self.get_environment()
+            self._command_prefix = prefix
+        return self._command_prefix
 
     def get_monitor(self) -> Optional[MonitoringHub]:
         """Get parsl monitor
@@ -161,3 +179,29 @@ class SiteConfig(ABC):
             logging_endpoint="sqlite:///"
             + get_bps_config_value(self.site, "monitorFilename", str, "monitor.sqlite"),
         )
+
+    def prepare_monitor(self, monitor: Optional[MonitoringHub]):
+        """Prepare the parsl monitor database before parsl starts
+
+        This implementation respects the BPS configuration element:
+
+        - ``site.<computeSite>.monitorWal`` (`bool`): use write-ahead logging
+          for the monitor sqlite database? This avoids a sync of the journal
+          for every transaction, which is much faster at high task rates, but
+          requires that all users of the database be on the same host.
+
+        Parameters
+        ----------
+        monitor : `MonitoringHub` or `None`
+            Parsl monitor, as provided by ``get_monitor``, or `None` for no
+            monitor. Only sqlite databases are prepared.
+        """
+        if monitor is None or not get_bps_config_value(self.site, "monitorWal", bool, False):
+            return
+        scheme, _, filename = monitor.logging_endpoint.partition(":///")
+        if scheme != "sqlite":
+            return
+        # The journal mode persists in the database file, so setting it here
+        # applies to the connections that parsl makes later.
+        with closing(sqlite3.connect(filename)) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
@@ -5,7 +5,6 @@ from parsl.executors.base import ParslExecutor
 from parsl.launchers import SrunLauncher
 
 from ..configuration import get_bps_config_value
-from ..environment import export_environment
 from .slurm import Slurm
 
 if TYPE_CHECKING:
@@ -50,7 +49,7 @@ class Tiger(Slurm):
                     min_blocks=1,
                     max_blocks=max_blocks,
                     parallelism=1.0,
-                    worker_init=export_environment(),
+                    worker_init=self.get_environment(),
                     launcher=SrunLauncher(),
                 ),
             )
@@ -51,6 +51,7 @@ class Slurm(SiteConfig):
         qos: Optional[str] = None,
         constraint: Optional[str] = None,
         singleton: bool = False,
+        address: Optional[str] = None,
         scheduler_options: Optional[str] = None,
         provider_options: Optional[ParamSpecKwargs] = None,
         executor_options: Optional[ParamSpecKwargs] = None,
@@ -77,6 +78,9 @@ class Slurm(SiteConfig):
             Node feature(s) to require for each Slurm job.
         singleton : `bool`, optional
             Allow only a single Slurm job to run at a time?
+        address : `str`, optional
+            IP address of the driver/submission node; by default we use the
+            return value of ``get_address``.
         scheduler_options : `str`, optional
             ``#SBATCH`` directives to prepend to the Slurm submission script.
         provider_options : `dict`, optional
@@ -96,14 +100,11 @@ class Slurm(SiteConfig):
         qos = get_bps_config_value(self.site, "qos", str, qos)
 
         job_name = get_workflow_name(self.config)
-        if scheduler_options is None:
-            scheduler_options = ""
-        scheduler_options += "\n"
-        scheduler_options += f"#SBATCH --job-name={job_name}\n"
+        directives = [scheduler_options or "", f"#SBATCH --job-name={job_name}"]
         if qos is not None:
-            scheduler_options += f"#SBATCH --qos={qos}\n"
+            directives.append(f"#SBATCH --qos={qos}")
         if constraint is not None:
-            scheduler_options += f"#SBATCH --constraint={constraint}\n"
+            directives.append(f"#SBATCH --constraint={constraint}")
         if singleton:
             # The following SBATCH directives allow only a single slurm job (parsl
             # block) with our job_name to run at once. This means we can have one job
@@ -111,7 +112,8 @@ class Slurm(SiteConfig):
             # limit. More backups could be achieved with a larger value of max_blocks.
             # This only allows one job to be actively running at once, so that needs
             # to be sized appropriately by the user.
-            scheduler_options += "#SBATCH --dependency=singleton\n"
+            directives.append("#SBATCH --dependency=singleton")
+        scheduler_options = "\n".join(directives) + "\n"
         return HighThroughputExecutor(
             label,
             provider=SlurmProvider(
@@ -123,7 +125,7 @@ class Slurm(SiteConfig):
                 **(provider_options or {}),
             ),
             mem_per_worker=mem_per_worker,
-            address=self.get_address(),
+            address=address if address is not None else self.get_address(),
             **(executor_options or {}),
         )
 
@@ -227,10 +229,14 @@ class TripleSlurm(Slurm):
         medium_options["mem_per_worker"] = medium_options.get("mem_per_worker", self.medium_memory)
         large_options["mem_per_worker"] = large_options.get("mem_per_worker", self.large_memory)
 
+        # Resolving the address can involve a network query, so only do it once.
+        if "address" not in common_options:
+            common_options["address"] = self.get_address()
+
         return [
-            self.make_executor("small", **small_options, **(common_options or {})),
-            self.make_executor("medium", **medium_options, **(common_options or {})),
-            self.make_executor("large", **large_options, **(common_options or {})),
+            self.make_executor("small", **small_options, **common_options),
+            self.make_executor("medium", **medium_options, **common_options),
+            self.make_executor("large", **large_options, **common_options),
         ]
 
     def select_executor(self, job: "ParslJob") -> str:
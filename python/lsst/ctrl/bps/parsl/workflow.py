@@ -1,7 +1,10 @@
 import logging
 import os
 import pickle
-from typing import Dict, Iterable, List, Mapping, Optional
+import shlex
+from concurrent.futures import wait
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import parsl
 import parsl.config
@@ -10,7 +13,7 @@ from parsl.app.app import bash_app
 from parsl.app.futures import Future
 
 from .configuration import get_bps_config_value, get_workflow_filename, set_parsl_logging
-from .job import ParslJob, get_file_paths
+from .job import ParslJob, get_file_paths, run_command
 from .site import SiteConfig
 
 __all__ = ("ParslWorkflow", "get_parsl_config")
@@ -18,7 +21,7 @@ __all__ = ("ParslWorkflow", "get_parsl_config")
 _log = logging.getLogger("lsst.ctrl.bps.parsl")
 
 
-def get_parsl_config(config: BpsConfig) -> parsl.config.Config:
+def get_parsl_config(config: BpsConfig, site: Optional[SiteConfig] = None) -> parsl.config.Config:
     """Construct parsl configuration from BPS configuration
 
     For details on the site configuration, see `SiteConfig`. For details on the
@@ -30,13 +33,17 @@ def get_parsl_config(config: BpsConfig) -> parsl.config.Config:
     ----------
     config : `BpsConfig`
         BPS configuration
+    site : `SiteConfig`, optional
+        Site configuration, if it has already been constructed from the
+        ``config``; otherwise it will be constructed here.
 
     Returns
     -------
     parsl_config : `parsl.config.Config`
         Parsl configuration.
     """
-    site = SiteConfig.from_config(config)
+    if site is None:
+        site = SiteConfig.from_config(config)
     executors = site.get_executors()
     retries = get_bps_config_value(site.site, "retries", int, 1)
     monitor = site.get_monitor()
@@ -83,21 +90,28 @@ class ParslWorkflow(BaseWmsWorkflow):
 
         self.path = path
         self.bps_config = config
-        self.parsl_config = get_parsl_config(config)
         self.site = SiteConfig.from_config(config)
+        self.parsl_config = get_parsl_config(config, self.site)
         self.dfk: Optional[parsl.DataFlowKernel] = None  # type: ignore
         self.command_prefix = self.site.get_command_prefix()
+        self._job_command_prefix: Optional[str] = None  # Set by write_command_prefix
 
         # these are function decorators
         self.apps = {
             ex.label: bash_app(executors=[ex.label], cache=True, ignore_for_cache=["stderr", "stdout"])
             for ex in self.parsl_config.executors
         }
+        # With a single executor, there's no need to ask the site to select one
+        executors = self.parsl_config.executors
+        self._single_label: Optional[str] = executors[0].label if len(executors) == 1 else None
+        # Parsl apps, indexed by executor label and job label
+        self._app_cache: Dict[Tuple[str, str], Callable[..., Future]] = {}
 
         self.jobs = jobs
         self.parents = parents
         self.endpoints = endpoints
         self.final = final
+        self._futures: Dict[str, Optional[Future]] = {}  # Results of execute, indexed by job name
 
     def __reduce__(self):
         """Recipe for pickle"""
@@ -133,22 +147,30 @@ class ParslWorkflow(BaseWmsWorkflow):
         self : `ParslWorkflow`
             Constructed workflow.
         """
-        # Generate list of jobs
+        # Generate list of jobs, resolving the log directory once for all jobs
+        log_dir = os.path.join(get_bps_config_value(config, "submitPath"), "logs")
         jobs: Dict[str, ParslJob] = {}
         for job_name in generic_workflow:
             generic_job = generic_workflow.get_job(job_name)
             assert generic_job.name not in jobs
-            jobs[job_name] = ParslJob(generic_job, config, get_file_paths(generic_workflow, job_name))
-
-        parents = {name: set(generic_workflow.predecessors(name)) for name in jobs}
-        endpoints = [name for name in jobs if generic_workflow.out_degree(name) == 0]
+            jobs[job_name] = ParslJob(
+                generic_job, config, get_file_paths(generic_workflow, job_name), log_dir
+            )
+
+        # Dependencies, from a single pass over the edges
+        parents: Dict[str, List[str]] = {name: [] for name in jobs}
+        has_children = set()
+        for parent, child in generic_workflow.edges():
+            parents[child].append(parent)
+            has_children.add(parent)
+        endpoints = [name for name in jobs if name not in has_children]
 
         # Add final job: execution butler merge
         job = generic_workflow.get_final()
         final: Optional[ParslJob] = None
         if job is not None:
             assert isinstance(job, GenericWorkflowJob)
-            final = ParslJob(job, config, get_file_paths(generic_workflow, job.name))
+            final = ParslJob(job, config, get_file_paths(generic_workflow, job.name), log_dir)
 
         return cls(generic_workflow.name, config, out_prefix, jobs, parents, endpoints, final)
 
@@ -167,7 +189,7 @@ class ParslWorkflow(BaseWmsWorkflow):
         filename = get_workflow_filename(out_prefix)
         _log.info("Writing workflow with ID=%s", out_prefix)
         with open(filename, "wb") as fd:
-            pickle.dump(self, fd)
+            pickle.dump(self, fd, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def read(cls, out_prefix: str) -> "ParslWorkflow":
@@ -208,21 +230,76 @@ class ParslWorkflow(BaseWmsWorkflow):
         """
         futures = [self.execute(name) for name in self.endpoints]
         if block:
-            # Calling .exception() for each future blocks returning
-            # from this method until all the jobs have executed or
-            # raised an error.  This is needed for running in a
-            # non-interactive python process that would otherwise end
-            # before the futures resolve.
-            for ff in futures:
-                if ff is not None:
-                    ff.exception()
+            # Wait until all the jobs have executed or raised an error.
+            # This is needed for running in a non-interactive python
+            # process that would otherwise end before the futures
+            # resolve. We don't return early on the first error: the
+            # final job and shutdown must wait for running jobs.
+            wait([ff for ff in futures if ff is not None])
             self.finalize_jobs()
             self.shutdown()
         return futures
 
+    def write_command_prefix(self):
+        """Write the command prefix to a file for the jobs to source
+
+        The command prefix from the site configuration can be large (e.g., if
+        it replicates the environment), and including it in every job's
+        command means that it is shipped to the workers and recorded by parsl
+        for every job. Instead, we write it once to ``command_prefix.sh`` in
+        the workflow directory (which we assume the workers can see, as for
+        the butler) and have each job source that file. The file may contain
+        secrets from the environment, so it is readable only by the user.
+
+        This is called by ``load_dfk``, before any job is executed.
+        """
+        prefix = ""
+        if self.command_prefix:
+            filename = os.path.abspath(os.path.join(self.path, "command_prefix.sh"))
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as file:
+                os.fchmod(fd, 0o600)  # The mode above only applies if the file is created
+                file.write(self.command_prefix + "\n")
+            prefix = f"source {shlex.quote(filename)}"
+        self._job_command_prefix = prefix
+
+    def _get_app(self, executor: str, label: str) -> Callable[..., Future]:
+        """Get the parsl app for a job
+
+        Constructing a parsl app involves inspecting the function signature,
+        so we construct each app only once, and reuse it for all jobs with
+        the same label running on the same executor. The app wraps
+        ``run_command`` with the job label as its name, which parsl uses for
+        tracking workflow status.
+
+        Parameters
+        ----------
+        executor : `str`
+            Label of the executor to run the job.
+        label : `str`
+            Job label, used as the app name for tracking workflow status.
+
+        Returns
+        -------
+        app : callable
+            Parsl app that runs the job command.
+        """
+        key = (executor, label)
+        app = self._app_cache.get(key)
+        if app is None:
+            func = partial(run_command)
+            setattr(func, "__name__", label)
+            app = self._app_cache[key] = self.apps[executor](func)
+        return app
+
     def execute(self, name: str) -> Optional[Future]:
         """Execute a job
 
+        The job's ancestors are executed first. The dependency tree is walked
+        iteratively rather than recursively, and the result for each job is
+        recorded, so that ancestors shared between jobs are only visited once
+        and deep trees can't exceed the recursion limit.
+
         Parameters
         ----------
         name : `str`
@@ -234,17 +311,37 @@ class ParslWorkflow(BaseWmsWorkflow):
             A `Future` object linked to the execution of the job, or `None` if
             the job is being reserved to run locally.
         """
-        if name in ("pipetaskInit", "mergeExecutionButler"):
-            # These get done outside of parsl
-            return None
-        job = self.jobs[name]
-        inputs = [self.execute(parent) for parent in self.parents[name]]
-        executors = self.parsl_config.executors
-        if len(executors) > 1:
-            label = self.site.select_executor(job)
-        else:
-            label = executors[0].label
-        return job.get_future(self.apps[label], [ff for ff in inputs if ff is not None], self.command_prefix)
+        command_prefix = self._job_command_prefix
+        if command_prefix is None:
+            raise RuntimeError("Workflow not started.")
+        futures = self._futures
+        stack = [name]
+        while stack:
+            current = stack[-1]
+            if current in futures:
+                stack.pop()
+                continue
+            if current in ("pipetaskInit", "mergeExecutionButler"):
+                # These get done outside of parsl
+                futures[current] = None
+                stack.pop()
+                continue
+            parents = self.parents[current]
+            pending = [parent for parent in parents if parent not in futures]
+            if pending:
+                # Come back to this job once its parents have been executed;
+                # reversed so that parents are submitted in their original order
+                stack.extend(reversed(pending))
+                continue
+            stack.pop()
+
+            job = self.jobs[current]
+            # Parents run outside of parsl have no future
+            inputs = [futures[parent] for parent in parents if futures[parent] is not None]
+            executor = self._single_label or self.site.select_executor(job)
+            app = self._get_app(executor, job.generic.label)
+            futures[current] = job.get_future(app, inputs, command_prefix)
+        return futures[name]
 
     def load_dfk(self):
         """Load data frame kernel
@@ -254,6 +351,8 @@ class ParslWorkflow(BaseWmsWorkflow):
         if self.dfk is not None:
             raise RuntimeError("Workflow has already started.")
         set_parsl_logging(self.bps_config)
+        self.write_command_prefix()
+        self.site.prepare_monitor(self.parsl_config.monitoring)
         self.dfk = parsl.load(self.parsl_config)
 
     def start(self):
@@ -0,0 +1,50 @@
+import unittest
+from types import SimpleNamespace
+
+from lsst.ctrl.bps.parsl.job import ParslJob
+
+
+class EvaluateCommandLineTestCase(unittest.TestCase):
+    """Tests for `ParslJob.evaluate_command_line`"""
+
+    def makeJob(self, cmdvals=None, file_paths=None):
+        """Construct a job with the provided BPS variables and file paths"""
+        generic = SimpleNamespace(name="job", label="label", cmdvals=cmdvals or {})
+        return ParslJob(generic, None, file_paths or {}, log_dir="/logs")
+
+    def testEnv(self):
+        """<ENV:X> becomes a bash variable"""
+        job = self.makeJob()
+        self.assertEqual(job.evaluate_command_line("echo <ENV:HOME>/x"), "echo ${HOME}/x")
+
+    def testFile(self):
+        """<FILE:x> becomes the file path"""
+        job = self.makeJob(file_paths={"butlerConfig": "/repo/butler.yaml"})
+        self.assertEqual(job.evaluate_command_line("-b <FILE:butlerConfig>"), "-b /repo/butler.yaml")
+
+    def testMixed(self):
+        """ENV and FILE symbols can be mixed and adjacent"""
+        job = self.makeJob(file_paths={"qgraph": "/submit/graph.qgraph"})
+        self.assertEqual(
+            job.evaluate_command_line("-g <FILE:qgraph> <ENV:A><ENV:B> <ENV:C>"),
+            "-g /submit/graph.qgraph ${A}${B} ${C}",
+        )
+        self.assertEqual(job.evaluate_command_line("<ENV:DIR>/<FILE:qgraph>"), "${DIR}//submit/graph.qgraph")
+
+    def testCmdvals(self):
+        """BPS variables are substituted, including into symbols"""
+        job = self.makeJob(cmdvals={"qgraphId": "123", "envName": "HOME"}, file_paths={"f": "/path"})
+        self.assertEqual(
+            job.evaluate_command_line("--id {qgraphId} <ENV:{envName}> <FILE:f>"),
+            "--id 123 ${HOME} /path",
+        )
+
+    def testMissingFile(self):
+        """An unknown FILE symbol raises"""
+        job = self.makeJob()
+        with self.assertRaises(KeyError):
+            job.evaluate_command_line("<FILE:missing>")
+
+
+if __name__ == "__main__":
+    unittest.main()
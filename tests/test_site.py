@@ -0,0 +1,59 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+
+from lsst.ctrl.bps import BpsConfig
+from lsst.ctrl.bps.parsl.site import SiteConfig
+from parsl.monitoring import MonitoringHub
+
+
+class StubSite(SiteConfig):
+    """Minimal concrete `SiteConfig`"""
+
+    def get_executors(self):
+        return []
+
+    def select_executor(self, job):
+        return "executor"
+
+
+class PrepareMonitorTestCase(unittest.TestCase):
+    """Tests for `SiteConfig.prepare_monitor`"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tempdir.name, "monitor.sqlite")
+        self.monitor = MonitoringHub(hub_address="localhost", logging_endpoint="sqlite:///" + self.filename)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def makeSite(self, **site):
+        """Construct a site configuration with the provided settings"""
+        return StubSite(BpsConfig({"computeSite": "test", "site": {"test": site}}))
+
+    def getJournalMode(self):
+        """Return the journal mode of the monitor database"""
+        with closing(sqlite3.connect(self.filename)) as connection:
+            return connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    def testWal(self):
+        """monitorWal leaves the monitor database in WAL mode"""
+        self.makeSite(monitorWal=True).prepare_monitor(self.monitor)
+        self.assertEqual(self.getJournalMode(), "wal")
+
+    def testNoWal(self):
+        """Without monitorWal, the database isn't touched"""
+        self.makeSite().prepare_monitor(self.monitor)
+        self.assertFalse(os.path.exists(self.filename))
+
+    def testNoMonitor(self):
+        """Without a monitor, there's nothing to do"""
+        self.makeSite(monitorWal=True).prepare_monitor(None)
+        self.assertFalse(os.path.exists(self.filename))
+
+
+if __name__ == "__main__":
+    unittest.main()
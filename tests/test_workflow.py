@@ -0,0 +1,160 @@
+import os
+import shlex
+import stat
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from lsst.ctrl.bps.parsl.workflow import ParslWorkflow
+
+
+class StubJob:
+    """Stand-in for `ParslJob` that records its submission
+
+    Parameters
+    ----------
+    name : `str`
+        Name of job.
+    submitted : `list` of `tuple`
+        Record of submissions, shared between jobs; ``get_future`` appends
+        the job name and the ``inputs`` provided.
+    """
+
+    def __init__(self, name, submitted):
+        self.name = name
+        self.generic = SimpleNamespace(label="label")
+        self.submitted = submitted
+
+    def get_future(self, app, inputs, command_prefix=None):
+        self.submitted.append((self.name, inputs))
+        return f"future:{self.name}"
+
+
+def makeWorkflow(parents=None, **kwargs):
+    """Construct a workflow with stub jobs, bypassing parsl and BPS
+
+    This is the only place that knows which attributes ``ParslWorkflow``
+    needs; keep it in sync with ``ParslWorkflow.__init__``.
+
+    Parameters
+    ----------
+    parents : `dict` mapping `str` to `list` of `str`, optional
+        Parent job names, indexed by job name.
+    **kwargs
+        Attributes to set on the workflow, overriding the defaults.
+
+    Returns
+    -------
+    workflow : `ParslWorkflow`
+        Workflow with stub jobs.
+    submitted : `list` of `tuple`
+        Record of job name and inputs for each submission, in order.
+    """
+    parents = parents or {}
+    submitted = []
+    workflow = ParslWorkflow.__new__(ParslWorkflow)
+    attributes = dict(
+        path=".",
+        command_prefix="",
+        jobs={name: StubJob(name, submitted) for name in parents},
+        parents=parents,
+        apps={"executor": lambda func: func},
+        _app_cache={},
+        _single_label="executor",
+        _job_command_prefix="",
+        _futures={},
+    )
+    attributes.update(kwargs)
+    for key, value in attributes.items():
+        setattr(workflow, key, value)
+    return workflow, submitted
+
+
+class ExecuteTestCase(unittest.TestCase):
+    """Tests for `ParslWorkflow.execute`"""
+
+    def testDiamond(self):
+        """Shared ancestors are submitted once, before their children"""
+        parents = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+        workflow, submitted = makeWorkflow(parents)
+        self.assertEqual(workflow.execute("d"), "future:d")
+        # Siblings are submitted in the order of their edges
+        self.assertEqual(
+            submitted,
+            [("a", []), ("b", ["future:a"]), ("c", ["future:a"]), ("d", ["future:b", "future:c"])],
+        )
+
+        # Executing again doesn't resubmit anything
+        self.assertEqual(workflow.execute("b"), "future:b")
+        self.assertEqual(len(submitted), 4)
+
+    def testPipetaskInit(self):
+        """Jobs run outside of parsl are not inputs"""
+        parents = {"pipetaskInit": [], "a": ["pipetaskInit"], "b": ["pipetaskInit", "a"]}
+        workflow, submitted = makeWorkflow(parents)
+        self.assertEqual(workflow.execute("b"), "future:b")
+        self.assertEqual(submitted, [("a", []), ("b", ["future:a"])])
+        self.assertIsNone(workflow.execute("pipetaskInit"))
+
+    def testDeepChain(self):
+        """A chain deeper than the recursion limit doesn't overflow"""
+        depth = sys.getrecursionlimit() + 100
+        names = [f"job{ii}" for ii in range(depth)]
+        parents = {names[0]: []}
+        parents.update((child, [parent]) for parent, child in zip(names, names[1:]))
+        workflow, submitted = makeWorkflow(parents)
+        self.assertEqual(workflow.execute(names[-1]), f"future:{names[-1]}")
+        self.assertEqual([name for name, _ in submitted], names)
+
+    def testNotStarted(self):
+        """Executing before the workflow has started raises"""
+        workflow, submitted = makeWorkflow({"a": []}, _job_command_prefix=None)
+        with self.assertRaises(RuntimeError):
+            workflow.execute("a")
+        self.assertEqual(submitted, [])
+
+
+class WriteCommandPrefixTestCase(unittest.TestCase):
+    """Tests for `ParslWorkflow.write_command_prefix`"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        # A space in the path checks that it's quoted
+        self.path = os.path.join(self.tempdir.name, "submit dir")
+        os.mkdir(self.path)
+        self.filename = os.path.join(self.path, "command_prefix.sh")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testEmpty(self):
+        """An empty prefix gives no source line and no file"""
+        workflow, _ = makeWorkflow(path=self.path, command_prefix="", _job_command_prefix=None)
+        workflow.write_command_prefix()
+        self.assertEqual(workflow._job_command_prefix, "")
+        self.assertFalse(os.path.exists(self.filename))
+
+    def testPrefix(self):
+        """The prefix is written to a private file, which is sourced"""
+        workflow, _ = makeWorkflow(path=self.path, command_prefix="export FOO=bar", _job_command_prefix=None)
+        workflow.write_command_prefix()
+        self.assertEqual(workflow._job_command_prefix, "source " + shlex.quote(self.filename))
+        with open(self.filename) as fd:
+            self.assertEqual(fd.read(), "export FOO=bar\n")
+        self.assertEqual(stat.S_IMODE(os.stat(self.filename).st_mode), 0o600)
+
+    def testExistingFile(self):
+        """An existing file is truncated and made private"""
+        with open(self.filename, "w") as fd:
+            fd.write("old contents that are longer than the new ones\n")
+        os.chmod(self.filename, 0o644)
+        workflow, _ = makeWorkflow(path=self.path, command_prefix="export FOO=bar")
+        workflow.write_command_prefix()
+        with open(self.filename) as fd:
+            self.assertEqual(fd.read(), "export FOO=bar\n")
+        self.assertEqual(stat.S_IMODE(os.stat(self.filename).st_mode), 0o600)
+
+
+if __name__ == "__main__":
+    unittest.main()